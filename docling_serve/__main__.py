@@ -10,6 +10,7 @@ import typer
 import uvicorn
 from rich.console import Console
 
+from docling_serve.datamodel.engines import AsyncEngine
 from docling_serve.settings import docling_serve_settings, uvicorn_settings
 
 warnings.filterwarnings(action="ignore", category=UserWarning, module="pydantic|torch")
@@ -105,6 +106,17 @@ def _run(
             "using the environment variable [bold]DOCLING_SERVE_ENABLE_UI[/bold].[/yellow]"
         )
 
+    if (
+        uvicorn_settings.workers is not None
+        and uvicorn_settings.workers > 1
+        and docling_serve_settings.eng_kind == AsyncEngine.LOCAL
+    ):
+        err_console.print(
+            "\n[yellow]:warning: The server will run with multiple workers and the local engine. \n"
+            "Each worker has its own tasks queue, so the async tasks can be queried only on \n"
+            "the worker which created them. Use [bold]DOCLING_SERVE_ENG_KIND=kfp[/bold] for a shared engine.[/yellow]"
+        )
+
     # Propagate the settings to the app settings
     docling_serve_settings.artifacts_path = artifacts_path
     docling_serve_settings.enable_ui = enable_ui
@@ -139,6 +151,8 @@ def _run(
         port=uvicorn_settings.port,
         reload=uvicorn_settings.reload,
         workers=uvicorn_settings.workers,
+        loop=uvicorn_settings.loop,
+        http=uvicorn_settings.http,
         root_path=uvicorn_settings.root_path,
         proxy_headers=uvicorn_settings.proxy_headers,
         timeout_keep_alive=uvicorn_settings.timeout_keep_alive,
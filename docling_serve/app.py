@@ -5,10 +5,11 @@ import shutil
 import time
 from contextlib import asynccontextmanager
 from io import BytesIO
-from typing import Annotated
+from typing import Annotated, Optional, Union
 
 from fastapi import (
     BackgroundTasks,
+    Body,
     Depends,
     FastAPI,
     HTTPException,
@@ -23,7 +24,12 @@ from fastapi.openapi.docs import (
     get_swagger_ui_html,
     get_swagger_ui_oauth2_redirect_html,
 )
-from fastapi.responses import RedirectResponse
+from fastapi.responses import (
+    FileResponse,
+    ORJSONResponse,
+    RedirectResponse,
+    Response,
+)
 from fastapi.staticfiles import StaticFiles
 
 from docling.datamodel.base_models import DocumentStream
@@ -50,10 +56,11 @@ from docling_serve.datamodel.responses import (
 )
 from docling_serve.datamodel.task import Task, TaskSource
 from docling_serve.chunk import MarkdownChunker, ChunkingConfig # Add this
-from docling_serve.docling_conversion import _get_converter_from_hash
+from docling_serve.docling_conversion import _get_converter_from_key
 from docling_serve.engines.async_orchestrator import (
     BaseAsyncOrchestrator,
     ProgressInvalid,
+    SubscriberQueue,
 )
 from docling_serve.engines.async_orchestrator_factory import get_async_orchestrator
 from docling_serve.engines.base_orchestrator import TaskNotFoundError
@@ -97,14 +104,24 @@ _log = logging.getLogger(__name__)
 # Context manager to initialize and clean up the lifespan of the FastAPI app
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    orchestrator = get_async_orchestrator()
+    orchestrator = await get_async_orchestrator()
     scratch_dir = get_scratch()
 
-    # Warm up processing cache
-    await orchestrator.warm_up_caches()
+    # Warm up processing cache in the background, so that the server accepts
+    # connections (e.g. health probes) while the models are loading. Tasks
+    # submitted in the meantime wait in the queue.
+    async def warm_up_and_process_queue():
+        try:
+            await orchestrator.warm_up_caches()
+        except Exception:
+            _log.exception("Warm up of the caches failed.")
+        await orchestrator.process_queue()
+
+    # Build the OpenAPI schema now, instead of on the first docs request
+    app.openapi()
 
     # Start the background queue processor
-    queue_task = asyncio.create_task(orchestrator.process_queue())
+    queue_task = asyncio.create_task(warm_up_and_process_queue())
 
     yield
 
@@ -117,7 +134,7 @@ async def lifespan(app: FastAPI):
 
     # Remove scratch directory in case it was a tempfile
     if docling_serve_settings.scratch_path is not None:
-        shutil.rmtree(scratch_dir, ignore_errors=True)
+        await asyncio.to_thread(shutil.rmtree, scratch_dir, ignore_errors=True)
 
 
 ##################################
@@ -147,6 +164,7 @@ def create_app():  # noqa: C901
         redoc_url=None if offline_docs_assets else "/redocs",
         lifespan=lifespan,
         version=version,
+        default_response_class=ORJSONResponse,
     )
 
     origins = docling_serve_settings.cors_origins
@@ -227,7 +245,7 @@ def create_app():  # noqa: C901
         sources: list[TaskSource] = []
         if isinstance(conversion_request, ConvertDocumentFileSourcesRequest):
             sources.extend(conversion_request.file_sources)
-        if isinstance(conversion_request, ConvertDocumentHttpSourcesRequest):
+        elif isinstance(conversion_request, ConvertDocumentHttpSourcesRequest):
             sources.extend(conversion_request.http_sources)
 
         task = await orchestrator.enqueue(
@@ -240,12 +258,16 @@ def create_app():  # noqa: C901
         files: list[UploadFile],
         options: ConvertDocumentsOptions,
     ) -> Task:
-        _log.info(f"Received {len(files)} files for processing.")
+        _log.info("Received %d files for processing.", len(files))
 
         # Load the uploaded files to Docling DocumentStream
         file_sources: list[TaskSource] = []
         for i, file in enumerate(files):
-            buf = BytesIO(file.file.read())
+            # Read the upload with the async API, to avoid blocking the event loop.
+            # The spooled file cannot be handed over directly, since it is closed
+            # at the end of the request. BytesIO shares the buffer of the bytes
+            # object, so this is the only copy of the content.
+            buf = BytesIO(await file.read())
             suffix = "" if len(file_sources) == 1 else f"_{i}"
             name = file.filename if file.filename else f"file{suffix}.pdf"
             file_sources.append(DocumentStream(name=name, stream=buf))
@@ -261,10 +283,41 @@ def create_app():  # noqa: C901
             task = await orchestrator.task_status(task_id=task_id)
             if task.is_completed():
                 return True
-            await asyncio.sleep(5)
             elapsed_time = time.monotonic() - start_time
-            if elapsed_time > docling_serve_settings.max_sync_wait:
+            remaining_time = docling_serve_settings.max_sync_wait - elapsed_time
+            if remaining_time <= 0:
                 return False
+            # Wake up as soon as the task is completed. The status is refreshed
+            # periodically only for engines which update it on request (e.g. KFP).
+            if orchestrator.status_poll_interval is not None:
+                remaining_time = min(remaining_time, orchestrator.status_poll_interval)
+            await task.wait_completed(timeout=remaining_time)
+
+    def _result_response(
+        result: Union[ConvertDocumentResponse, FileResponse],
+    ) -> Response:
+        # The result was already validated when the orchestrator built it,
+        # serialize it once instead of validating it again as response_model
+        if isinstance(result, ConvertDocumentResponse):
+            return Response(
+                content=result.model_dump_json(by_alias=True),
+                media_type="application/json",
+            )
+        return result
+
+    def _task_status_response(task: Task, task_position: Optional[int]) -> Response:
+        # Built from the trusted task state, serialize it once instead of
+        # validating it again as response_model
+        task_response = TaskStatusResponse.model_construct(
+            task_id=task.task_id,
+            task_status=task.task_status,
+            task_position=task_position,
+            task_meta=task.processing_meta,
+        )
+        return Response(
+            content=task_response.model_dump_json(),
+            media_type="application/json",
+        )
 
     #############################
     # API Endpoints definitions #
@@ -279,14 +332,17 @@ def create_app():  # noqa: C901
         response = RedirectResponse(url=logo_url)
         return response
 
-    @app.get("/health")
-    def health() -> HealthCheckResponse:
-        return HealthCheckResponse()
+    # The health response never changes, serialize it only once
+    health_content = HealthCheckResponse().model_dump_json()
+
+    @app.get("/health", response_model=HealthCheckResponse)
+    async def health() -> Response:
+        return Response(content=health_content, media_type="application/json")
 
     # API readiness compatibility for OpenShift AI Workbench
-    @app.get("/api", include_in_schema=False)
-    def api_check() -> HealthCheckResponse:
-        return HealthCheckResponse()
+    @app.get("/api", response_model=HealthCheckResponse, include_in_schema=False)
+    async def api_check() -> Response:
+        return Response(content=health_content, media_type="application/json")
 
     # Convert a document from URL(s)
     @app.post(
@@ -302,7 +358,7 @@ def create_app():  # noqa: C901
     async def process_url(
         background_tasks: BackgroundTasks,
         orchestrator: Annotated[BaseAsyncOrchestrator, Depends(get_async_orchestrator)],
-        conversion_request: ConvertDocumentsRequest,
+        conversion_request: Annotated[ConvertDocumentsRequest, Body()],
     ):
         task = await _enque_source(
             orchestrator=orchestrator, conversion_request=conversion_request
@@ -313,7 +369,7 @@ def create_app():  # noqa: C901
 
         if not success:
             # TODO: abort task!
-            return HTTPException(
+            raise HTTPException(
                 status_code=504,
                 detail=f"Conversion is taking too long. The maximum wait time is configure as DOCLING_SERVE_MAX_SYNC_WAIT={docling_serve_settings.max_sync_wait}.",
             )
@@ -326,7 +382,7 @@ def create_app():  # noqa: C901
                 status_code=404,
                 detail="Task result not found. Please wait for a completion status.",
             )
-        return result
+        return _result_response(result)
 
     # Convert a document from file(s)
     @app.post(
@@ -355,7 +411,7 @@ def create_app():  # noqa: C901
 
         if not success:
             # TODO: abort task!
-            return HTTPException(
+            raise HTTPException(
                 status_code=504,
                 detail=f"Conversion is taking too long. The maximum wait time is configure as DOCLING_SERVE_MAX_SYNC_WAIT={docling_serve_settings.max_sync_wait}.",
             )
@@ -368,7 +424,7 @@ def create_app():  # noqa: C901
                 status_code=404,
                 detail="Task result not found. Please wait for a completion status.",
             )
-        return result
+        return _result_response(result)
 
     # Convert a document from URL(s) using the async api
     @app.post(
@@ -377,7 +433,7 @@ def create_app():  # noqa: C901
     )
     async def process_url_async(
         orchestrator: Annotated[BaseAsyncOrchestrator, Depends(get_async_orchestrator)],
-        conversion_request: ConvertDocumentsRequest,
+        conversion_request: Annotated[ConvertDocumentsRequest, Body()],
     ):
         task = await _enque_source(
             orchestrator=orchestrator, conversion_request=conversion_request
@@ -385,12 +441,7 @@ def create_app():  # noqa: C901
         task_queue_position = await orchestrator.get_queue_position(
             task_id=task.task_id
         )
-        return TaskStatusResponse(
-            task_id=task.task_id,
-            task_status=task.task_status,
-            task_position=task_queue_position,
-            task_meta=task.processing_meta,
-        )
+        return _task_status_response(task, task_queue_position)
 
     # Convert a document from file(s) using the async api
     @app.post(
@@ -411,12 +462,7 @@ def create_app():  # noqa: C901
         task_queue_position = await orchestrator.get_queue_position(
             task_id=task.task_id
         )
-        return TaskStatusResponse(
-            task_id=task.task_id,
-            task_status=task.task_status,
-            task_position=task_queue_position,
-            task_meta=task.processing_meta,
-        )
+        return _task_status_response(task, task_queue_position)
 
     # Task status poll
     @app.get(
@@ -431,16 +477,12 @@ def create_app():  # noqa: C901
         ] = 0.0,
     ):
         try:
-            task = await orchestrator.task_status(task_id=task_id, wait=wait)
-            task_queue_position = await orchestrator.get_queue_position(task_id=task_id)
+            task, task_queue_position = await orchestrator.task_status_with_position(
+                task_id=task_id, wait=wait
+            )
         except TaskNotFoundError:
             raise HTTPException(status_code=404, detail="Task not found.")
-        return TaskStatusResponse(
-            task_id=task.task_id,
-            task_status=task.task_status,
-            task_position=task_queue_position,
-            task_meta=task.processing_meta,
-        )
+        return _task_status_response(task, task_queue_position)
 
     # Task status websocket
     @app.websocket(
@@ -453,7 +495,8 @@ def create_app():  # noqa: C901
     ):
         await websocket.accept()
 
-        if task_id not in orchestrator.tasks:
+        task = orchestrator.tasks.get(task_id)
+        if task is None:
             await websocket.send_text(
                 WebsocketMessage(
                     message=MessageKind.ERROR, error="Task not found."
@@ -462,48 +505,51 @@ def create_app():  # noqa: C901
             await websocket.close()
             return
 
-        task = orchestrator.tasks[task_id]
+        async def _send_updates(queue: SubscriberQueue):
+            while (message := await queue.get()) is not None:
+                await websocket.send_text(message)
+
+        async def _receive_messages():
+            # Client messages are not needed, they are only consumed
+            # to detect disconnections
+            while True:
+                msg = await websocket.receive_text()
+                _log.debug("Received message: %s", msg)
 
-        # Track active WebSocket connections for this job
-        orchestrator.task_subscribers[task_id].add(websocket)
+        # Build the connection message and subscribe without awaiting in between,
+        # so that all the queued updates are newer than the connection message
+        task_queue_position = await orchestrator.get_queue_position(task_id=task_id)
+        connection_message = task.get_status_message(
+            MessageKind.CONNECTION, task_queue_position
+        )
+        queue = orchestrator.subscribe(task_id)
 
         try:
-            task_queue_position = await orchestrator.get_queue_position(task_id=task_id)
-            task_response = TaskStatusResponse(
-                task_id=task.task_id,
-                task_status=task.task_status,
-                task_position=task_queue_position,
-                task_meta=task.processing_meta,
-            )
-            await websocket.send_text(
-                WebsocketMessage(
-                    message=MessageKind.CONNECTION, task=task_response
-                ).model_dump_json()
-            )
-            while True:
-                task_queue_position = await orchestrator.get_queue_position(
-                    task_id=task_id
+            await websocket.send_text(connection_message)
+            if not task.is_completed():
+                sender = asyncio.create_task(_send_updates(queue))
+                receiver = asyncio.create_task(_receive_messages())
+                done, pending = await asyncio.wait(
+                    [sender, receiver], return_when=asyncio.FIRST_COMPLETED
                 )
-                task_response = TaskStatusResponse(
-                    task_id=task.task_id,
-                    task_status=task.task_status,
-                    task_position=task_queue_position,
-                    task_meta=task.processing_meta,
-                )
-                await websocket.send_text(
-                    WebsocketMessage(
-                        message=MessageKind.UPDATE, task=task_response
-                    ).model_dump_json()
-                )
-                # each client message will be interpreted as a request for update
-                msg = await websocket.receive_text()
-                _log.debug(f"Received message: {msg}")
+                for pending_task in pending:
+                    pending_task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+                for done_task in done:
+                    done_task.result()
 
         except WebSocketDisconnect:
-            _log.info(f"WebSocket disconnected for job {task_id}")
+            _log.info("WebSocket disconnected for job %s", task_id)
+
+        except (RuntimeError, OSError) as err:
+            # Sending on a socket which was already closed by the client
+            _log.info("WebSocket closed for job %s: %s", task_id, err)
+
+        else:
+            await websocket.close()
 
         finally:
-            orchestrator.task_subscribers[task_id].remove(websocket)
+            orchestrator.unsubscribe(task_id, queue)
 
     # Task result
     @app.get(
@@ -528,7 +574,7 @@ def create_app():  # noqa: C901
                 status_code=404,
                 detail="Task result not found. Please wait for a completion status.",
             )
-        return result
+        return _result_response(result)
 
     # Update task progress
     @app.post(
@@ -557,7 +603,7 @@ def create_app():  # noqa: C901
         response_model=ClearResponse,
     )
     async def clear_converters():
-        _get_converter_from_hash.cache_clear()
+        _get_converter_from_key.cache_clear()
         return ClearResponse()
 
     # Clean results
@@ -591,10 +637,16 @@ def create_app():  # noqa: C901
 
             statistics = chunker.get_chunk_statistics(chunks_list)
 
-            return MarkdownChunkResponse(
+            # The chunks were built by the chunker, serialize them once instead
+            # of validating and encoding them again as response_model
+            chunk_response = MarkdownChunkResponse.model_construct(
                 chunks=chunks_list,
                 statistics=statistics,
             )
+            return Response(
+                content=chunk_response.model_dump_json(),
+                media_type="application/json",
+            )
         except Exception as e:
             _log.error(f"Error during markdown chunking: {e}", exc_info=True)
             return MarkdownChunkResponse(
@@ -1,7 +1,9 @@
 import re
+from collections import OrderedDict, deque
 from typing import List, Optional, Dict, Tuple
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 import tiktoken
 from docling_serve.datamodel.chunk_models import FileItemChunk
 
@@ -12,6 +14,25 @@ class OverlapStrategy(Enum):
     SEMANTIC = "semantic"  # 语义相关重叠
 
 
+class ParagraphKind(Enum):
+    """段落类型枚举"""
+    PARAGRAPH = "paragraph"
+    HEADER = "header"
+    LIST_ITEM = "list_item"
+    CODE_DELIMITER = "code_delimiter"
+    TABLE_ROW = "table_row"
+
+
+@dataclass
+class ParagraphInfo:
+    """段落的预分类结果，每个段落只做一次正则匹配"""
+    kind: ParagraphKind
+    level: int  # 标题级别或列表缩进级别
+    tokens: int
+    text: str  # 去除首尾空白后的段落
+    raw: str  # 原始段落（保留代码块中的缩进）
+
+
 @dataclass
 class ChunkingConfig:
     """分块配置类"""
@@ -26,31 +47,75 @@ class ChunkingConfig:
     encoding_name: str = "cl100k_base"
 
 
+# token缓存的最大条目数
+_TOKEN_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=8)
+def _get_encoder(encoding_name: str) -> tiktoken.Encoding:
+    """进程内共享的tiktoken编码器，避免每个分块器重复加载BPE表"""
+    return tiktoken.get_encoding(encoding_name)
+
+
 class MarkdownChunker:
     """优化的Markdown文本分块器"""
     
     def __init__(self, config: Optional[ChunkingConfig] = None):
         self.config = config or ChunkingConfig()
-        self.encoder = tiktoken.get_encoding(self.config.encoding_name)
+        self.encoder = _get_encoder(self.config.encoding_name)
         # 预编译正则表达式
         self._sentence_pattern = re.compile(r'([。！？.!?])')
         self._header_pattern = re.compile(r'^(#{1,6})\s+(.+)$')
         self._list_pattern = re.compile(r'^(\s*)([-*+]|\d+\.)\s+(.+)$')
         self._code_block_pattern = re.compile(r'^```')
         self._table_separator_pattern = re.compile(r'^:?-+:?$')
+        # 合并的分类正则，对去除空白后的段落一次匹配即可确定类型
+        self._classify_pattern = re.compile(
+            r'^(?:(?P<code>```)|(?P<table>\|)|(?P<list>[-*+]|\d+\.)\s+.|(?P<header>#{1,6})\s+.)'
+        )
         
-        # 缓存token计算结果
-        self._token_cache: Dict[str, int] = {}
+        # 缓存token计算结果（LRU，以文本的哈希为键，不保存文本副本）
+        self._token_cache: OrderedDict[int, int] = OrderedDict()
+    
+    def _get_cached_tokens(self, key: int) -> Optional[int]:
+        token_count = self._token_cache.get(key)
+        if token_count is not None:
+            self._token_cache.move_to_end(key)
+        return token_count
+    
+    def _set_cached_tokens(self, key: int, token_count: int) -> None:
+        self._token_cache[key] = token_count
+        if len(self._token_cache) > _TOKEN_CACHE_SIZE:
+            self._token_cache.popitem(last=False)
     
     def count_tokens(self, text: str) -> int:
         """计算文本的tokens数量，带缓存"""
-        if text in self._token_cache:
-            return self._token_cache[text]
-        
-        token_count = len(self.encoder.encode(text))
-        self._token_cache[text] = token_count
+        key = hash(text)
+        token_count = self._get_cached_tokens(key)
+        if token_count is None:
+            token_count = len(self.encoder.encode_ordinary(text))
+            self._set_cached_tokens(key, token_count)
         return token_count
     
+    def count_tokens_batch(self, texts: List[str]) -> List[int]:
+        """批量计算tokens数量，未缓存的文本一次性交给tiktoken并行编码"""
+        keys = [hash(text) for text in texts]
+        counts: Dict[int, int] = {}
+        missing: Dict[int, str] = {}
+        for key, text in zip(keys, texts):
+            token_count = self._get_cached_tokens(key)
+            if token_count is None:
+                missing[key] = text
+            else:
+                counts[key] = token_count
+        
+        if missing:
+            token_lists = self.encoder.encode_ordinary_batch(list(missing.values()))
+            for key, tokens in zip(missing, token_lists):
+                counts[key] = len(tokens)
+                self._set_cached_tokens(key, len(tokens))
+        return [counts[key] for key in keys]
+    
     def is_header(self, text: str) -> Tuple[bool, int]:
         """判断是否为标题，返回(是否为标题, 标题级别)"""
         text = text.strip()
@@ -97,18 +162,36 @@ class MarkdownChunker:
         # 检查是否为数据行（至少有一个非空单元格）
         return any(cell for cell in cells)
     
+    def classify_paragraph(self, raw: str, text: str, tokens: int) -> ParagraphInfo:
+        """对段落进行一次性分类，text为去除首尾空白后的raw"""
+        match = self._classify_pattern.match(text)
+        if match is None:
+            return ParagraphInfo(ParagraphKind.PARAGRAPH, 0, tokens, text, raw)
+        kind = match.lastgroup
+        if kind == 'code':
+            return ParagraphInfo(ParagraphKind.CODE_DELIMITER, 0, tokens, text, raw)
+        if kind == 'table' and self.is_table_row(text):
+            return ParagraphInfo(ParagraphKind.TABLE_ROW, 0, tokens, text, raw)
+        if kind == 'list':
+            # 段落已去除首部空白，与is_list_item(text)一致，缩进级别为0
+            return ParagraphInfo(ParagraphKind.LIST_ITEM, 0, tokens, text, raw)
+        if kind == 'header':
+            level = len(match.group('header'))
+            return ParagraphInfo(ParagraphKind.HEADER, level, tokens, text, raw)
+        return ParagraphInfo(ParagraphKind.PARAGRAPH, 0, tokens, text, raw)
+    
     def split_sentences(self, text: str) -> List[str]:
         """将文本分割成句子"""
-        sentences = self._sentence_pattern.split(text)
         result = []
-        for i in range(0, len(sentences)-1, 2):
-            if i+1 < len(sentences):
-                result.append(sentences[i] + sentences[i+1])
-        if len(sentences) % 2 == 1 and sentences[-1].strip():
-            result.append(sentences[-1])
+        end = 0
+        for match in self._sentence_pattern.finditer(text):
+            result.append(text[end:match.end()])
+            end = match.end()
+        if end < len(text):
+            result.append(text[end:])
         return [s for s in result if s.strip()]
     
-    def find_semantic_boundary(self, paragraphs: List[str], start_idx: int) -> int:
+    def find_semantic_boundary(self, infos: List[ParagraphInfo], start_idx: int) -> int:
         """
         寻找语义边界，优先选择标题、列表结束等位置
         """
@@ -116,75 +199,66 @@ class MarkdownChunker:
             return start_idx
         
         # 向前查看几个段落，寻找合适的分割点
-        look_ahead = min(3, len(paragraphs) - start_idx)
+        look_ahead = min(3, len(infos) - start_idx)
         
         for i in range(start_idx, start_idx + look_ahead):
-            para = paragraphs[i].strip()
-            if not para:
-                continue
-                
+            kind = infos[i].kind
+            
             # 优先在标题前分割
-            if self.is_header(para)[0]:
+            if kind == ParagraphKind.HEADER:
                 return i
             
             # 在列表结束后分割
-            if i > 0 and self.is_list_item(paragraphs[i-1])[0] and not self.is_list_item(para)[0]:
+            if i > 0 and infos[i-1].kind == ParagraphKind.LIST_ITEM and kind != ParagraphKind.LIST_ITEM:
                 return i
         
         return start_idx
     
-    def collect_complete_structure(self, paragraphs: List[str], start_idx: int) -> Tuple[List[str], int]:
+    def collect_complete_structure(self, infos: List[ParagraphInfo], start_idx: int) -> Tuple[List[str], int]:
         """
         收集完整的结构（表格、列表、代码块等）
         返回(结构内容, 下一个索引)
         """
-        if start_idx >= len(paragraphs):
+        if start_idx >= len(infos):
             return [], start_idx
         
-        current_para = paragraphs[start_idx].strip()
+        current = infos[start_idx]
         
         # 处理代码块
-        if self.config.preserve_code_blocks and self.is_code_block_delimiter(current_para):
-            code_block = [current_para]
+        if self.config.preserve_code_blocks and current.kind == ParagraphKind.CODE_DELIMITER:
+            code_block = [current.text]
             i = start_idx + 1
-            while i < len(paragraphs):
-                code_block.append(paragraphs[i])
-                if self.is_code_block_delimiter(paragraphs[i].strip()):
+            while i < len(infos):
+                code_block.append(infos[i].raw)
+                if infos[i].kind == ParagraphKind.CODE_DELIMITER:
                     break
                 i += 1
             return code_block, i + 1
         
         # 处理表格
-        if self.config.preserve_tables and self.is_table_row(current_para):
-            table_rows = [current_para]
+        if self.config.preserve_tables and current.kind == ParagraphKind.TABLE_ROW:
+            table_rows = [current.text]
             i = start_idx + 1
-            while i < len(paragraphs) and self.is_table_row(paragraphs[i].strip()):
-                table_rows.append(paragraphs[i].strip())
+            while i < len(infos) and infos[i].kind == ParagraphKind.TABLE_ROW:
+                table_rows.append(infos[i].text)
                 i += 1
             return table_rows, i
         
         # 处理列表
-        if self.config.preserve_lists and self.is_list_item(current_para)[0]:
-            list_items = [current_para]
-            current_level = self.is_list_item(current_para)[1]
+        if self.config.preserve_lists and current.kind == ParagraphKind.LIST_ITEM:
+            list_items = [current.text]
             i = start_idx + 1
-            
-            while i < len(paragraphs):
-                para = paragraphs[i].strip()
-                if not para:
-                    i += 1
-                    continue
-                    
-                is_list, level = self.is_list_item(para)
-                if is_list and level >= current_level:
-                    list_items.append(para)
+            while i < len(infos):
+                info = infos[i]
+                if info.kind == ParagraphKind.LIST_ITEM and info.level >= current.level:
+                    list_items.append(info.text)
                 else:
                     break
                 i += 1
             return list_items, i
         
         # 普通段落
-        return [current_para], start_idx + 1
+        return [current.text], start_idx + 1
     
     def get_semantic_overlap(self, current_chunk: List[str], overlap_tokens: int) -> List[str]:
         """
@@ -193,7 +267,7 @@ class MarkdownChunker:
         if not current_chunk or self.config.overlap_strategy == OverlapStrategy.FIXED:
             return self.get_fixed_overlap(current_chunk, overlap_tokens)
         
-        overlap_paras = []
+        overlap_paras: deque[str] = deque()
         total_tokens = 0
         
         # 从后向前寻找合适的重叠内容
@@ -203,18 +277,18 @@ class MarkdownChunker:
             
             # 如果是标题，优先包含
             if self.is_header(para)[0] and total_tokens + para_tokens <= overlap_tokens:
-                overlap_paras.insert(0, para)
+                overlap_paras.appendleft(para)
                 total_tokens += para_tokens
                 break  # 找到标题就停止
             
             # 如果添加当前段落不超过限制
             if total_tokens + para_tokens <= overlap_tokens:
-                overlap_paras.insert(0, para)
+                overlap_paras.appendleft(para)
                 total_tokens += para_tokens
             else:
                 break
         
-        return overlap_paras if overlap_paras else self.get_fixed_overlap(current_chunk, overlap_tokens)
+        return list(overlap_paras) if overlap_paras else self.get_fixed_overlap(current_chunk, overlap_tokens)
     
     def get_fixed_overlap(self, current_chunk: List[str], overlap_tokens: int) -> List[str]:
         """
@@ -223,7 +297,7 @@ class MarkdownChunker:
         if not current_chunk:
             return []
         
-        overlap_paras = []
+        overlap_paras: deque[str] = deque()
         total_tokens = 0
         
         # 从后向前收集段落
@@ -235,18 +309,18 @@ class MarkdownChunker:
                 sentences = self.split_sentences(para)
                 if not sentences:
                     # 如果无法按句子分割，直接截取tokens
-                    tokens = self.encoder.encode(para)
+                    tokens = self.encoder.encode_ordinary(para)
                     overlap_text = self.encoder.decode(tokens[-overlap_tokens:])
                     overlap_paras.append(overlap_text.lstrip())
                 else:
                     # 按句子收集
-                    selected_sentences = []
+                    selected_sentences: deque[str] = deque()
                     current_tokens = 0
                     
                     for sent in reversed(sentences):
                         sent_tokens = self.count_tokens(sent)
                         if current_tokens + sent_tokens <= overlap_tokens:
-                            selected_sentences.insert(0, sent)
+                            selected_sentences.appendleft(sent)
                             current_tokens += sent_tokens
                         else:
                             break
@@ -256,21 +330,22 @@ class MarkdownChunker:
                 break
             
             elif total_tokens + para_tokens <= overlap_tokens:
-                overlap_paras.insert(0, para)
+                overlap_paras.appendleft(para)
                 total_tokens += para_tokens
             else:
                 break
         
-        return overlap_paras
+        return list(overlap_paras)
     
     def evaluate_chunk_quality(self, chunk_content: str) -> bool:
         """
         评估块的质量
         """
-        if not chunk_content.strip():
+        stripped_content = chunk_content.strip()
+        if not stripped_content:
             return False
         
-        lines = chunk_content.strip().split('\n')
+        lines = stripped_content.split('\n')
         token_count = self.count_tokens(chunk_content)
         
         # 检查最小token数量
@@ -287,37 +362,50 @@ class MarkdownChunker:
         """
         主要的文本分块函数
         """
-        if not content_md.strip():
+        content_md = content_md.strip()
+        if not content_md:
             return []
         
         # 清理和预处理
-        paragraphs = [p for p in re.split(r'\n\n|\n', content_md.strip()) if p.strip()]
+        raw_paragraphs = []
+        paragraphs = []  # 每个段落只去除一次首尾空白
+        for para in content_md.split('\n'):
+            text = para.strip()
+            if text:
+                raw_paragraphs.append(para)
+                paragraphs.append(text)
+        # 预先批量计算所有段落的tokens，并对每个段落分类一次
+        token_counts = self.count_tokens_batch(paragraphs)
+        infos = [
+            self.classify_paragraph(raw, text, tokens)
+            for raw, text, tokens in zip(raw_paragraphs, paragraphs, token_counts)
+        ]
         
         chunks_list = []
-        current_chunk = []
+        current_chunk: List[str] = []
         current_tokens = 0
         i = 0
         
         while i < len(paragraphs):
             # 收集完整结构
-            structure_content, next_i = self.collect_complete_structure(paragraphs, i)
+            structure_content, next_i = self.collect_complete_structure(infos, i)
             
             if not structure_content:
                 i = next_i
                 continue
             
             structure_text = '\n'.join(structure_content)
-            structure_tokens = self.count_tokens(structure_text)
+            if len(structure_content) == 1:
+                structure_tokens = infos[i].tokens
+            else:
+                structure_tokens = self.count_tokens(structure_text)
             
             # 检查是否需要分块
             if current_tokens + structure_tokens > self.config.max_tokens and current_chunk:
-                # 寻找语义边界
-                boundary_idx = self.find_semantic_boundary(paragraphs, i)
-                
                 # 保存当前块
                 chunk_content = '\n'.join(current_chunk)
                 if self.evaluate_chunk_quality(chunk_content):
-                    chunks_list.append(FileItemChunk(
+                    chunks_list.append(FileItemChunk.model_construct(
                         content=chunk_content,
                         tokens=current_tokens
                     ))
@@ -330,7 +418,9 @@ class MarkdownChunker:
                 
                 # 开始新块
                 current_chunk = overlap_content.copy()
-                current_tokens = self.count_tokens('\n'.join(current_chunk)) if current_chunk else 0
+                # 重叠段落的tokens已在缓存中，累加后再计入换行符（各1个token）
+                current_tokens = sum(self.count_tokens(para) for para in current_chunk)
+                current_tokens += max(0, len(current_chunk) - 1)
             
             # 添加当前结构到块中
             if structure_tokens > self.config.max_tokens:
@@ -339,7 +429,7 @@ class MarkdownChunker:
                     # 先保存当前块
                     chunk_content = '\n'.join(current_chunk)
                     if self.evaluate_chunk_quality(chunk_content):
-                        chunks_list.append(FileItemChunk(
+                        chunks_list.append(FileItemChunk.model_construct(
                             content=chunk_content,
                             tokens=current_tokens
                         ))
@@ -347,7 +437,7 @@ class MarkdownChunker:
                     current_tokens = 0
                 
                 # 将大结构作为单独的块
-                chunks_list.append(FileItemChunk(
+                chunks_list.append(FileItemChunk.model_construct(
                     content=structure_text,
                     tokens=structure_tokens
                 ))
@@ -361,7 +451,7 @@ class MarkdownChunker:
         if current_chunk:
             chunk_content = '\n'.join(current_chunk)
             if self.evaluate_chunk_quality(chunk_content):
-                chunks_list.append(FileItemChunk(
+                chunks_list.append(FileItemChunk.model_construct(
                     content=chunk_content,
                     tokens=current_tokens
                 ))
@@ -373,14 +463,23 @@ class MarkdownChunker:
         if not chunks:
             return {}
         
-        token_counts = [chunk.tokens for chunk in chunks]
+        # 单次遍历计算总数、最小值和最大值
+        total_tokens = min_tokens = max_tokens = chunks[0].tokens or 0
+        for chunk in chunks[1:]:
+            tokens = chunk.tokens or 0
+            total_tokens += tokens
+            if tokens < min_tokens:
+                min_tokens = tokens
+            elif tokens > max_tokens:
+                max_tokens = tokens
+        
         return {
             'total_chunks': len(chunks),
-            'total_tokens': sum(token_counts),
-            'avg_tokens_per_chunk': sum(token_counts) / len(chunks),
-            'min_tokens': min(token_counts),
-            'max_tokens': max(token_counts),
-            'cache_hit_rate': len(self._token_cache) / max(1, len(token_counts))
+            'total_tokens': total_tokens,
+            'avg_tokens_per_chunk': total_tokens / len(chunks),
+            'min_tokens': min_tokens,
+            'max_tokens': max_tokens,
+            'cache_hit_rate': len(self._token_cache) / len(chunks)
         }
 
 
@@ -1,5 +1,5 @@
 # docling_serve/datamodel/chunk_models.py
-from typing import Annotated, List, Optional
+from typing import Annotated, Optional
 
 from pydantic import BaseModel, Field
 
@@ -17,7 +17,7 @@ class FileItemChunk(BaseModel):
 
 class Chunks(BaseModel):
     chunks: Annotated[
-        List[FileItemChunk],
+        list[FileItemChunk],
         Field(
             default_factory=list,
             description="The chunks of the document"
@@ -1,5 +1,5 @@
 # Define the input options for the API
-from typing import Annotated, Any, Optional, List, TYPE_CHECKING
+from typing import TYPE_CHECKING, Annotated, Any, Optional
 
 from pydantic import AnyUrl, BaseModel, Field, model_validator
 from typing_extensions import Self
@@ -33,6 +33,12 @@ ocr_factory = get_ocr_factory(
 )
 ocr_engines_enum = ocr_factory.get_enum()
 
+# Defaults of the docling options, read without instantiating the options
+_DEFAULT_TABLE_MODE = TableStructureOptions.model_fields["mode"].default
+_DEFAULT_PICTURE_AREA_THRESHOLD = PictureDescriptionBaseOptions.model_fields[
+    "picture_area_threshold"
+].default
+
 
 class PictureDescriptionLocal(BaseModel):
     repo_id: Annotated[
@@ -58,10 +64,11 @@ class PictureDescriptionLocal(BaseModel):
     generation_config: Annotated[
         dict[str, Any],
         Field(
+            default_factory=lambda: {"max_new_tokens": 200, "do_sample": False},
             description="Config from https://huggingface.co/docs/transformers/en/main_classes/text_generation#transformers.GenerationConfig",
             examples=[{"max_new_tokens": 200, "do_sample": False}],
         ),
-    ] = {"max_new_tokens": 200, "do_sample": False}
+    ]
 
 
 class PictureDescriptionApi(BaseModel):
@@ -82,12 +89,14 @@ class PictureDescriptionApi(BaseModel):
     headers: Annotated[
         dict[str, str],
         Field(
-            description="Headers used for calling the API endpoint. For example, it could include authentication headers."
+            default_factory=dict,
+            description="Headers used for calling the API endpoint. For example, it could include authentication headers.",
         ),
-    ] = {}
+    ]
     params: Annotated[
         dict[str, Any],
         Field(
+            default_factory=dict,
             description="Model parameters.",
             examples=[
                 {  # on vllm
@@ -103,7 +112,7 @@ class PictureDescriptionApi(BaseModel):
                 },
             ],
         ),
-    ] = {}
+    ]
     timeout: Annotated[float, Field(description="Timeout for the API request.")] = 20
     prompt: Annotated[
         str,
@@ -245,10 +254,10 @@ class ConvertDocumentsOptions(BaseModel):
                 f"Allowed values: {', '.join([v.value for v in TableFormerMode])}. "
                 "Optional, defaults to fast."
             ),
-            examples=[TableStructureOptions().mode],
+            examples=[_DEFAULT_TABLE_MODE],
             # pattern="fast|accurate",
         ),
-    ] = TableStructureOptions().mode
+    ] = _DEFAULT_TABLE_MODE
 
     pipeline: Annotated[
         PdfPipeline,
@@ -380,9 +389,9 @@ class ConvertDocumentsOptions(BaseModel):
         float,
         Field(
             description="Minimum percentage of the area for a picture to be processed with the models.",
-            examples=[PictureDescriptionBaseOptions().picture_area_threshold],
+            examples=[_DEFAULT_PICTURE_AREA_THRESHOLD],
         ),
-    ] = PictureDescriptionBaseOptions().picture_area_threshold
+    ] = _DEFAULT_PICTURE_AREA_THRESHOLD
 
     picture_description_local: Annotated[
         Optional[PictureDescriptionLocal],
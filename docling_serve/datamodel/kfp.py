@@ -1,7 +1,7 @@
-from pydantic import AnyUrl, BaseModel
+from pydantic import AnyUrl, BaseModel, Field
 
 
 class CallbackSpec(BaseModel):
     url: AnyUrl
-    headers: dict[str, str] = {}
+    headers: dict[str, str] = Field(default_factory=dict)
     ca_cert: str = ""
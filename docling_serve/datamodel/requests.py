@@ -2,7 +2,7 @@ import base64
 from io import BytesIO
 from typing import Annotated, Any, Union, Optional # Add Optional
 
-from pydantic import AnyHttpUrl, BaseModel, Field
+from pydantic import AnyHttpUrl, BaseModel, Discriminator, Field, Tag
 
 from docling_serve.chunk import ChunkingConfig # Add this import
 
@@ -11,8 +11,12 @@ from docling.datamodel.base_models import DocumentStream
 from docling_serve.datamodel.convert import ConvertDocumentsOptions
 
 
+# Size of the base64 slices decoded at once, a multiple of 4
+_BASE64_CHUNK_SIZE = 4 * 1024 * 1024
+
+
 class DocumentsConvertBase(BaseModel):
-    options: ConvertDocumentsOptions = ConvertDocumentsOptions()
+    options: ConvertDocumentsOptions = Field(default_factory=ConvertDocumentsOptions)
 
 
 class HttpSource(BaseModel):
@@ -26,10 +30,11 @@ class HttpSource(BaseModel):
     headers: Annotated[
         dict[str, Any],
         Field(
+            default_factory=dict,
             description="Additional headers used to fetch the urls, "
-            "e.g. authorization, agent, etc"
+            "e.g. authorization, agent, etc",
         ),
-    ] = {}
+    ]
 
 
 class FileSource(BaseModel):
@@ -47,7 +52,18 @@ class FileSource(BaseModel):
     ]
 
     def to_document_stream(self) -> DocumentStream:
-        buf = BytesIO(base64.b64decode(self.base64_string))
+        # Decode in slices, b64decode() would first copy the whole string to bytes
+        buf = BytesIO()
+        pending = ""
+        for start in range(0, len(self.base64_string), _BASE64_CHUNK_SIZE):
+            data = self.base64_string[start : start + _BASE64_CHUNK_SIZE]
+            # Drop line breaks, so that the decoded slices stay 4 chars aligned
+            chunk = pending + "".join(data.split())
+            end = len(chunk) - len(chunk) % 4
+            buf.write(base64.b64decode(chunk[:end]))
+            pending = chunk[end:]
+        buf.write(base64.b64decode(pending))
+        buf.seek(0)
         return DocumentStream(stream=buf, name=self.filename)
 
 
@@ -59,8 +75,20 @@ class ConvertDocumentFileSourcesRequest(DocumentsConvertBase):
     file_sources: list[FileSource]
 
 
-ConvertDocumentsRequest = Union[
-    ConvertDocumentFileSourcesRequest, ConvertDocumentHttpSourcesRequest
+def _get_sources_kind(value: Any) -> str:
+    if isinstance(value, dict):
+        return "file" if "file_sources" in value else "http"
+    return "file" if isinstance(value, ConvertDocumentFileSourcesRequest) else "http"
+
+
+# Discriminated on the sources field, so the request body is validated only
+# against the matching model instead of trying each member of the union
+ConvertDocumentsRequest = Annotated[
+    Union[
+        Annotated[ConvertDocumentFileSourcesRequest, Tag("file")],
+        Annotated[ConvertDocumentHttpSourcesRequest, Tag("http")],
+    ],
+    Discriminator(_get_sources_kind),
 ]
 
 
@@ -1,5 +1,5 @@
 import enum
-from typing import Optional, List, Dict, Any # Add List, Dict, Any
+from typing import Any, Optional
 
 from pydantic import BaseModel, Field # Add Field
 
@@ -27,15 +27,15 @@ class DocumentResponse(BaseModel):
     html_content: Optional[str] = None
     text_content: Optional[str] = None
     doctags_content: Optional[str] = None
-    md_chunks: Optional[List[FileItemChunk]] = Field(default=None, description="List of markdown chunks, if requested.") # New field
+    md_chunks: Optional[list[FileItemChunk]] = Field(default=None, description="List of markdown chunks, if requested.") # New field
 
 
 class ConvertDocumentResponse(BaseModel):
     document: DocumentResponse
     status: ConversionStatus
-    errors: list[ErrorItem] = []
+    errors: list[ErrorItem] = Field(default_factory=list)
     processing_time: float
-    timings: dict[str, ProfilingItem] = {}
+    timings: dict[str, ProfilingItem] = Field(default_factory=dict)
 
 
 class ConvertDocumentErrorResponse(BaseModel):
@@ -62,6 +62,6 @@ class WebsocketMessage(BaseModel):
 
 
 class MarkdownChunkResponse(BaseModel):
-    chunks: List[FileItemChunk] = Field(default_factory=list, description="A list of markdown chunks.")
-    statistics: Optional[Dict[str, Any]] = Field(default=None, description="Optional statistics about the chunking process.")
+    chunks: list[FileItemChunk] = Field(default_factory=list, description="A list of markdown chunks.")
+    statistics: Optional[dict[str, Any]] = Field(default=None, description="Optional statistics about the chunking process.")
     error: Optional[str] = Field(default=None, description="An optional error message if chunking fails.")
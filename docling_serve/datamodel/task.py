@@ -1,17 +1,23 @@
+import asyncio
 import datetime
 from functools import partial
 from pathlib import Path
 from typing import Optional, Union
 
 from fastapi.responses import FileResponse
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from docling.datamodel.base_models import DocumentStream
 
 from docling_serve.datamodel.convert import ConvertDocumentsOptions
 from docling_serve.datamodel.engines import TaskStatus
 from docling_serve.datamodel.requests import FileSource, HttpSource
-from docling_serve.datamodel.responses import ConvertDocumentResponse
+from docling_serve.datamodel.responses import (
+    ConvertDocumentResponse,
+    MessageKind,
+    TaskStatusResponse,
+    WebsocketMessage,
+)
 from docling_serve.datamodel.task_meta import TaskProcessingMeta
 
 TaskSource = Union[HttpSource, FileSource, DocumentStream]
@@ -22,7 +28,7 @@ class Task(BaseModel):
 
     task_id: str
     task_status: TaskStatus = TaskStatus.PENDING
-    sources: list[TaskSource] = []
+    sources: list[TaskSource] = Field(default_factory=list)
     options: Optional[ConvertDocumentsOptions]
     result: Optional[Union[ConvertDocumentResponse, FileResponse]] = None
     scratch_dir: Optional[Path] = None
@@ -32,8 +38,16 @@ class Task(BaseModel):
     )
     started_at: Optional[datetime.datetime] = None
     finished_at: Optional[datetime.datetime] = None
+    # Same timestamp as created_at, instead of reading the clock again
     last_update_at: datetime.datetime = Field(
-        default_factory=partial(datetime.datetime.now, datetime.timezone.utc)
+        default_factory=lambda data: data["created_at"]
+    )
+
+    # Set when the task reaches a terminal status
+    _completed_event: asyncio.Event = PrivateAttr(default_factory=asyncio.Event)
+    # Serialized status message per kind, with the queue position it was built for
+    _status_messages: dict[MessageKind, tuple[Optional[int], str]] = PrivateAttr(
+        default_factory=dict
     )
 
     def set_status(self, status: TaskStatus):
@@ -47,9 +61,47 @@ class Task(BaseModel):
             self.finished_at = now
 
         self.last_update_at = now
-        self.task_status = status
+        if status != self.task_status:
+            self.task_status = status
+            self.invalidate_status()
+
+        if self.is_completed():
+            self._completed_event.set()
+
+    def invalidate_status(self):
+        """Drop the cached status message, to be called when the task is mutated."""
+        self._status_messages.clear()
+
+    def get_status_message(
+        self, message: MessageKind, task_position: Optional[int]
+    ) -> str:
+        """Serialized WebsocketMessage with the task status, cached until changed."""
+        cached = self._status_messages.get(message)
+        if cached is not None and cached[0] == task_position:
+            return cached[1]
+
+        # Built from the task state, which was already validated
+        task_response = TaskStatusResponse.model_construct(
+            task_id=self.task_id,
+            task_status=self.task_status,
+            task_position=task_position,
+            task_meta=self.processing_meta,
+        )
+        serialized = WebsocketMessage.model_construct(
+            message=message, task=task_response
+        ).model_dump_json()
+        self._status_messages[message] = (task_position, serialized)
+        return serialized
 
     def is_completed(self) -> bool:
         if self.task_status in [TaskStatus.SUCCESS, TaskStatus.FAILURE]:
             return True
         return False
+
+    async def wait_completed(self, timeout: float) -> bool:
+        """Wait until the task is completed, return False on timeout."""
+        try:
+            await asyncio.wait_for(self._completed_event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
@@ -1,5 +1,4 @@
 import hashlib
-import json
 import logging
 import sys
 from collections.abc import Iterable, Iterator
@@ -7,6 +6,7 @@ from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional, Union
 
+import orjson
 from fastapi import HTTPException
 
 from docling.backend.docling_parse_backend import DoclingParseDocumentBackend
@@ -57,20 +57,33 @@ def _hash_pdf_format_option(pdf_format_option: PdfFormatOption) -> bytes:
     data["backend"] = repr(data["backend"])
 
     # Serialize the dictionary to JSON with sorted keys to have consistent hashes
-    serialized_data = json.dumps(data, sort_keys=True)
-    options_hash = hashlib.sha1(
-        serialized_data.encode(), usedforsecurity=False
-    ).digest()
+    serialized_data = orjson.dumps(
+        data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+    )
+    options_hash = hashlib.sha1(serialized_data, usedforsecurity=False).digest()
     return options_hash
 
 
-# Cache of DocumentConverter objects
-_options_map: dict[bytes, PdfFormatOption] = {}
+# Cache key of a PdfFormatOption, compared by its hash. The options are kept
+# in the key, so they are released together with the cached converter.
+class _PdfFormatOptionKey:
+    def __init__(self, pdf_format_option: PdfFormatOption):
+        self.pdf_format_option = pdf_format_option
+        self.options_hash = _hash_pdf_format_option(pdf_format_option)
+
+    def __hash__(self) -> int:
+        return hash(self.options_hash)
 
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, _PdfFormatOptionKey):
+            return NotImplemented
+        return self.options_hash == other.options_hash
 
+
+# Cache of DocumentConverter objects
 @lru_cache(maxsize=docling_serve_settings.options_cache_size)
-def _get_converter_from_hash(options_hash: bytes) -> DocumentConverter:
-    pdf_format_option = _options_map[options_hash]
+def _get_converter_from_key(key: _PdfFormatOptionKey) -> DocumentConverter:
+    pdf_format_option = key.pdf_format_option
     format_options: dict[InputFormat, FormatOption] = {
         InputFormat.PDF: pdf_format_option,
         InputFormat.IMAGE: pdf_format_option,
@@ -80,9 +93,7 @@ def _get_converter_from_hash(options_hash: bytes) -> DocumentConverter:
 
 
 def get_converter(pdf_format_option: PdfFormatOption) -> DocumentConverter:
-    options_hash = _hash_pdf_format_option(pdf_format_option)
-    _options_map[options_hash] = pdf_format_option
-    return _get_converter_from_hash(options_hash)
+    return _get_converter_from_key(_PdfFormatOptionKey(pdf_format_option))
 
 
 def _parse_standard_pdf_opts(
@@ -238,13 +249,48 @@ def get_pdf_pipeline_opts(
     return pdf_format_option
 
 
+# Fields of ConvertDocumentsOptions used by get_pdf_pipeline_opts()
+_PDF_PIPELINE_FIELDS = {
+    "do_ocr",
+    "force_ocr",
+    "ocr_engine",
+    "ocr_lang",
+    "pdf_backend",
+    "table_mode",
+    "pipeline",
+    "document_timeout",
+    "do_table_structure",
+    "image_export_mode",
+    "images_scale",
+    "do_code_enrichment",
+    "do_formula_enrichment",
+    "do_picture_classification",
+    "do_picture_description",
+    "picture_description_area_threshold",
+    "picture_description_local",
+    "picture_description_api",
+}
+
+
+@lru_cache(maxsize=docling_serve_settings.options_cache_size)
+def _get_options_key(options_json: str) -> _PdfFormatOptionKey:
+    request = ConvertDocumentsOptions.model_validate_json(options_json)
+    return _PdfFormatOptionKey(get_pdf_pipeline_opts(request))
+
+
+def get_converter_for_options(options: ConvertDocumentsOptions) -> DocumentConverter:
+    # Building and hashing the PdfFormatOption is cached by the pipeline
+    # related request options, which are much cheaper to serialize
+    options_json = options.model_dump_json(include=_PDF_PIPELINE_FIELDS)
+    return _get_converter_from_key(_get_options_key(options_json))
+
+
 def convert_documents(
     sources: Iterable[Union[Path, str, DocumentStream]],
     options: ConvertDocumentsOptions,
     headers: Optional[dict[str, Any]] = None,
 ):
-    pdf_format_option = get_pdf_pipeline_opts(options)
-    converter = get_converter(pdf_format_option)
+    converter = get_converter_for_options(options)
     results: Iterator[ConversionResult] = converter.convert_all(
         sources,
         headers=headers,
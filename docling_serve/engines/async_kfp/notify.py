@@ -14,18 +14,28 @@ def notify_callbacks(
     if len(callbacks) == 0:
         return
 
+    # Serialize the payload once for all the callbacks
+    content = payload.model_dump_json()
+    default_ctx = None
+
     for callback in callbacks:
         # https://www.python-httpx.org/advanced/ssl/#configuring-client-instances
         if callback.ca_cert:
             ctx = ssl.create_default_context(cadata=callback.ca_cert)
         else:
-            ctx = ssl.create_default_context(cafile=certifi.where())
+            # Loading the certifi bundle is expensive, share it among callbacks
+            if default_ctx is None:
+                default_ctx = ssl.create_default_context(cafile=certifi.where())
+            ctx = default_ctx
+
+        headers = httpx.Headers(callback.headers)
+        headers.setdefault("Content-Type", "application/json")
 
         try:
             httpx.post(
                 str(callback.url),
-                headers=callback.headers,
-                json=payload.model_dump(mode="json"),
+                headers=headers,
+                content=content,
                 verify=ctx,
             )
         except httpx.HTTPError as err:
@@ -41,6 +41,9 @@ class _RunItem(BaseModel):
 
 
 class AsyncKfpOrchestrator(BaseAsyncOrchestrator):
+    # The task status is only updated from the KFP run when requested
+    status_poll_interval = 5.0
+
     def __init__(self):
         super().__init__()
         import kfp
@@ -188,6 +191,13 @@ class AsyncKfpOrchestrator(BaseAsyncOrchestrator):
                 return pos
         return None
 
+    async def get_queue_positions(
+        self, task_ids: list[str]
+    ) -> dict[str, Optional[int]]:
+        runs = await self._get_pending()
+        positions = {run.run_id: pos for pos, run in enumerate(runs, start=1)}
+        return {task_id: positions.get(task_id) for task_id in task_ids}
+
     async def process_queue(self):
         return
 
@@ -231,5 +241,7 @@ class AsyncKfpOrchestrator(BaseAsyncOrchestrator):
             task.processing_meta.num_failed += progress.num_failed
             task.task_status = TaskStatus.STARTED
 
+        task.invalidate_status()
+
         # TODO: could be moved to BackgroundTask
         await self.notify_task_subscribers(task_id=task_id)
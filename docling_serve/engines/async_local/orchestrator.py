@@ -3,9 +3,11 @@ import logging
 import uuid
 from typing import Optional
 
+from docling.datamodel.base_models import InputFormat
+
 from docling_serve.datamodel.convert import ConvertDocumentsOptions
 from docling_serve.datamodel.task import Task, TaskSource
-from docling_serve.docling_conversion import get_converter, get_pdf_pipeline_opts
+from docling_serve.docling_conversion import get_converter_for_options
 from docling_serve.engines.async_local.worker import AsyncLocalWorker
 from docling_serve.engines.async_orchestrator import BaseAsyncOrchestrator
 from docling_serve.settings import docling_serve_settings
@@ -17,7 +19,11 @@ class AsyncLocalOrchestrator(BaseAsyncOrchestrator):
     def __init__(self):
         super().__init__()
         self.task_queue = asyncio.Queue()
-        self.queue_list: list[str] = []
+        # Enqueue index of the pending tasks. The queue is FIFO, so together with
+        # the number of dequeued tasks it gives the queue position in O(1).
+        self.queue_indices: dict[str, int] = {}
+        self.num_enqueued = 0
+        self.num_dequeued = 0
 
     async def enqueue(
         self, sources: list[TaskSource], options: ConvertDocumentsOptions
@@ -26,17 +32,25 @@ class AsyncLocalOrchestrator(BaseAsyncOrchestrator):
         task = Task(task_id=task_id, sources=sources, options=options)
         await self.init_task_tracking(task)
 
-        self.queue_list.append(task_id)
+        self.queue_indices[task_id] = self.num_enqueued
+        self.num_enqueued += 1
         await self.task_queue.put(task_id)
         return task
 
+    async def dequeue(self) -> str:
+        task_id: str = await self.task_queue.get()
+        del self.queue_indices[task_id]
+        self.num_dequeued += 1
+        return task_id
+
     async def queue_size(self) -> int:
         return self.task_queue.qsize()
 
     async def get_queue_position(self, task_id: str) -> Optional[int]:
-        return (
-            self.queue_list.index(task_id) + 1 if task_id in self.queue_list else None
-        )
+        index = self.queue_indices.get(task_id)
+        if index is None:
+            return None
+        return index - self.num_dequeued + 1
 
     async def process_queue(self):
         # Create a pool of workers
@@ -53,5 +67,8 @@ class AsyncLocalOrchestrator(BaseAsyncOrchestrator):
 
     async def warm_up_caches(self):
         # Converter with default options
-        pdf_format_option = get_pdf_pipeline_opts(ConvertDocumentsOptions())
-        get_converter(pdf_format_option)
+        converter = get_converter_for_options(ConvertDocumentsOptions())
+        if docling_serve_settings.load_models_at_boot:
+            # Load the models now, instead of on the first request. PDF and
+            # images share the same pipeline, initializing it once is enough.
+            await asyncio.to_thread(converter.initialize_pipeline, InputFormat.PDF)
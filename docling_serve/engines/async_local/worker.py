@@ -2,6 +2,7 @@ import asyncio
 import logging
 import shutil
 import time
+from collections.abc import Iterator
 from typing import TYPE_CHECKING, Any, Optional, Union
 
 from fastapi.responses import FileResponse
@@ -28,16 +29,15 @@ class AsyncLocalWorker:
     async def loop(self):
         _log.debug(f"Starting loop for worker {self.worker_id}")
         while True:
-            task_id: str = await self.orchestrator.task_queue.get()
-            self.orchestrator.queue_list.remove(task_id)
+            task_id = await self.orchestrator.dequeue()
 
-            if task_id not in self.orchestrator.tasks:
+            task = self.orchestrator.tasks.get(task_id)
+            if task is None:
                 raise RuntimeError(f"Task {task_id} not found.")
-            task = self.orchestrator.tasks[task_id]
 
             try:
                 task.set_status(TaskStatus.STARTED)
-                _log.info(f"Worker {self.worker_id} processing task {task_id}")
+                _log.info("Worker %s processing task %s", self.worker_id, task_id)
 
                 # Notify clients about task updates
                 await self.orchestrator.notify_task_subscribers(task_id)
@@ -48,17 +48,26 @@ class AsyncLocalWorker:
                 # Define a callback function to send progress updates to the client.
                 # TODO: send partial updates, e.g. when a document in the batch is done
                 def run_conversion():
-                    convert_sources: list[Union[str, DocumentStream]] = []
-                    headers: Optional[dict[str, Any]] = None
-                    for source in task.sources:
-                        if isinstance(source, DocumentStream):
-                            convert_sources.append(source)
-                        elif isinstance(source, FileSource):
-                            convert_sources.append(source.to_document_stream())
-                        elif isinstance(source, HttpSource):
-                            convert_sources.append(str(source.url))
-                            if headers is None and source.headers:
-                                headers = source.headers
+                    # The sources are generated while docling consumes them,
+                    # so that the decoded files are not all held at once
+                    def iter_sources() -> Iterator[Union[str, DocumentStream]]:
+                        for source in task.sources:
+                            if isinstance(source, DocumentStream):
+                                yield source
+                            elif isinstance(source, FileSource):
+                                yield source.to_document_stream()
+                            elif isinstance(source, HttpSource):
+                                yield str(source.url)
+
+                    headers: Optional[dict[str, Any]] = next(
+                        (
+                            source.headers
+                            for source in task.sources
+                            if isinstance(source, HttpSource) and source.headers
+                        ),
+                        None,
+                    )
+                    convert_sources = iter_sources()
 
                     # Note: results are only an iterator->lazy evaluation
                     results = convert_documents(
@@ -108,17 +117,19 @@ class AsyncLocalWorker:
 
                 task.set_status(TaskStatus.SUCCESS)
                 _log.info(
-                    f"Worker {self.worker_id} completed job {task_id} "
-                    f"in {processing_time:.2f} seconds"
+                    "Worker %s completed job %s in %.2f seconds",
+                    self.worker_id,
+                    task_id,
+                    processing_time,
                 )
 
             except Exception as e:
                 _log.error(
-                    f"Worker {self.worker_id} failed to process job {task_id}: {e}"
+                    "Worker %s failed to process job %s: %s", self.worker_id, task_id, e
                 )
                 task.set_status(TaskStatus.FAILURE)
 
             finally:
                 await self.orchestrator.notify_task_subscribers(task_id)
                 self.orchestrator.task_queue.task_done()
-                _log.debug(f"Worker {self.worker_id} completely done with {task_id}")
+                _log.debug("Worker %s completely done with %s", self.worker_id, task_id)
@@ -2,19 +2,14 @@ import asyncio
 import datetime
 import logging
 import shutil
-from typing import Union
+from typing import Optional, Union
 
-from fastapi import BackgroundTasks, WebSocket
+from fastapi import BackgroundTasks
 from fastapi.responses import FileResponse
 
 from docling_serve.datamodel.callback import ProgressCallbackRequest
 from docling_serve.datamodel.engines import TaskStatus
-from docling_serve.datamodel.responses import (
-    ConvertDocumentResponse,
-    MessageKind,
-    TaskStatusResponse,
-    WebsocketMessage,
-)
+from docling_serve.datamodel.responses import ConvertDocumentResponse, MessageKind
 from docling_serve.datamodel.task import Task
 from docling_serve.engines.base_orchestrator import (
     BaseOrchestrator,
@@ -30,23 +25,64 @@ class ProgressInvalid(OrchestratorError):
     pass
 
 
+# Queue of serialized messages for a subscriber, None signals the end of the stream
+SubscriberQueue = asyncio.Queue[Optional[str]]
+_SUBSCRIBER_QUEUE_SIZE = 16
+
+
+def _publish(queue: SubscriberQueue, message: Optional[str]):
+    # Status messages are snapshots, a slow subscriber only needs the latest ones
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(message)
+
+
 class BaseAsyncOrchestrator(BaseOrchestrator):
+    # Interval for refreshing the status of a task while waiting on it,
+    # None when the status is updated by the engine itself
+    status_poll_interval: Optional[float] = None
+
     def __init__(self):
         self.tasks: dict[str, Task] = {}
-        self.task_subscribers: dict[str, set[WebSocket]] = {}
+        self.task_subscribers: dict[str, set[SubscriberQueue]] = {}
 
     async def init_task_tracking(self, task: Task):
         task_id = task.task_id
         self.tasks[task.task_id] = task
         self.task_subscribers[task_id] = set()
 
+    def subscribe(self, task_id: str) -> SubscriberQueue:
+        queue: SubscriberQueue = asyncio.Queue(maxsize=_SUBSCRIBER_QUEUE_SIZE)
+        self.task_subscribers[task_id].add(queue)
+        return queue
+
+    def unsubscribe(self, task_id: str, queue: SubscriberQueue):
+        subscribers = self.task_subscribers.get(task_id)
+        if subscribers is not None:
+            subscribers.discard(queue)
+
     async def get_raw_task(self, task_id: str) -> Task:
-        if task_id not in self.tasks:
+        task = self.tasks.get(task_id)
+        if task is None:
             raise TaskNotFoundError()
-        return self.tasks[task_id]
+        return task
 
     async def task_status(self, task_id: str, wait: float = 0.0) -> Task:
-        return await self.get_raw_task(task_id=task_id)
+        task = await self.get_raw_task(task_id=task_id)
+        if wait > 0 and not task.is_completed():
+            # Woken up by the status change, no polling
+            await task.wait_completed(timeout=wait)
+        return task
+
+    async def task_status_with_position(
+        self, task_id: str, wait: float = 0.0
+    ) -> tuple[Task, Optional[int]]:
+        task = await self.task_status(task_id=task_id, wait=wait)
+        # Only the pending tasks are in the queue, skip the lookup for the others
+        if task.task_status != TaskStatus.PENDING:
+            return task, None
+        task_queue_position = await self.get_queue_position(task_id=task_id)
+        return task, task_queue_position
 
     async def task_result(
         self, task_id: str, background_tasks: BackgroundTasks
@@ -73,15 +109,13 @@ class BaseAsyncOrchestrator(BaseOrchestrator):
             return None
 
     async def delete_task(self, task_id: str):
-        _log.info(f"Deleting {task_id=}")
-        if task_id in self.task_subscribers:
-            for websocket in self.task_subscribers[task_id]:
-                await websocket.close()
-
-            del self.task_subscribers[task_id]
+        _log.info("Deleting task_id=%r", task_id)
+        subscribers = self.task_subscribers.pop(task_id, None)
+        if subscribers is not None:
+            for queue in subscribers:
+                _publish(queue, None)
 
-        if task_id in self.tasks:
-            del self.tasks[task_id]
+        self.tasks.pop(task_id, None)
 
     async def clear_results(self, older_than: float = 0.0):
         cutoff_time = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(
@@ -96,32 +130,43 @@ class BaseAsyncOrchestrator(BaseOrchestrator):
         for task_id in tasks_to_delete:
             await self.delete_task(task_id=task_id)
 
+    async def get_queue_positions(
+        self, task_ids: list[str]
+    ) -> dict[str, Optional[int]]:
+        return {
+            task_id: await self.get_queue_position(task_id=task_id)
+            for task_id in task_ids
+        }
+
+    def _publish_task_status(self, task: Task, task_queue_position: Optional[int]):
+        message = task.get_status_message(MessageKind.UPDATE, task_queue_position)
+        for queue in self.task_subscribers[task.task_id]:
+            _publish(queue, message)
+            if task.is_completed():
+                _publish(queue, None)
+
     async def notify_task_subscribers(self, task_id: str):
         if task_id not in self.task_subscribers:
             raise RuntimeError(f"Task {task_id} does not have a subscribers list.")
 
         task = await self.get_raw_task(task_id=task_id)
         task_queue_position = await self.get_queue_position(task_id)
-        msg = TaskStatusResponse(
-            task_id=task.task_id,
-            task_status=task.task_status,
-            task_position=task_queue_position,
-            task_meta=task.processing_meta,
-        )
-        for websocket in self.task_subscribers[task_id]:
-            await websocket.send_text(
-                WebsocketMessage(message=MessageKind.UPDATE, task=msg).model_dump_json()
-            )
-            if task.is_completed():
-                await websocket.close()
+        self._publish_task_status(task, task_queue_position)
 
     async def notify_queue_positions(self):
-        for task_id in self.task_subscribers.keys():
-            # notify only pending tasks
-            if self.tasks[task_id].task_status != TaskStatus.PENDING:
-                continue
+        # notify only pending tasks which have subscribers
+        task_ids = [
+            task_id
+            for task_id, subscribers in self.task_subscribers.items()
+            if subscribers and self.tasks[task_id].task_status == TaskStatus.PENDING
+        ]
+        if not task_ids:
+            return
 
-            await self.notify_task_subscribers(task_id)
+        # Compute all the positions at once, instead of one queue scan per task
+        positions = await self.get_queue_positions(task_ids)
+        for task_id in task_ids:
+            self._publish_task_status(self.tasks[task_id], positions[task_id])
 
     async def receive_task_progress(self, request: ProgressCallbackRequest):
         raise NotImplementedError()
@@ -6,7 +6,7 @@ from docling_serve.settings import docling_serve_settings
 
 
 @lru_cache
-def get_async_orchestrator() -> BaseAsyncOrchestrator:
+def _create_async_orchestrator() -> BaseAsyncOrchestrator:
     if docling_serve_settings.eng_kind == AsyncEngine.LOCAL:
         from docling_serve.engines.async_local.orchestrator import (
             AsyncLocalOrchestrator,
@@ -19,3 +19,9 @@ def get_async_orchestrator() -> BaseAsyncOrchestrator:
         return AsyncKfpOrchestrator()
 
     raise RuntimeError(f"Engine {docling_serve_settings.eng_kind} not recognized.")
+
+
+# Async dependency, so FastAPI resolves it on the event loop instead of
+# dispatching each call to the threadpool like plain `def` dependencies
+async def get_async_orchestrator() -> BaseAsyncOrchestrator:
+    return _create_async_orchestrator()
@@ -31,6 +31,8 @@ def is_pydantic_model(type_):
 # https://github.com/fastapi/fastapi/discussions/8971#discussioncomment-7892972
 def FormDepends(cls: type[BaseModel]):
     new_parameters = []
+    # Validators of the nested models, built once instead of on every request
+    json_validators: dict[str, TypeAdapter] = {}
 
     for field_name, model_field in cls.model_fields.items():
         annotation = model_field.annotation
@@ -47,6 +49,7 @@ def FormDepends(cls: type[BaseModel]):
 
         # Flatten nested Pydantic models by accepting them as JSON strings
         if is_pydantic_model(annotation):
+            json_validators[field_name] = TypeAdapter(annotation)
             annotation = str
             default = Form(
                 None
@@ -71,14 +74,12 @@ def FormDepends(cls: type[BaseModel]):
         )
 
     async def as_form_func(**data):
-        for field_name, model_field in cls.model_fields.items():
+        for field_name, validator in json_validators.items():
             value = data.get(field_name)
-            annotation = model_field.annotation
 
             # Parse nested models from JSON string
-            if value is not None and is_pydantic_model(annotation):
+            if value is not None:
                 try:
-                    validator = TypeAdapter(annotation)
                     data[field_name] = validator.validate_json(value)
                 except Exception as e:
                     raise ValueError(f"Invalid JSON for field '{field_name}': {e}")
@@ -33,7 +33,7 @@ def _export_document_as_content(
     do_markdown_chunking: bool,
     markdown_chunking_config: Optional[ChunkingConfig],
 ):
-    document = DocumentResponse(filename=conv_res.input.file.name)
+    document = DocumentResponse.model_construct(filename=conv_res.input.file.name)
 
     if conv_res.status == ConversionStatus.SUCCESS:
         new_doc = conv_res.document._make_copy_with_refmode(Path(), image_mode)
@@ -202,7 +202,8 @@ def process_results(
             markdown_chunking_config=conversion_options.markdown_chunking_config,
         )
 
-        response = ConvertDocumentResponse(
+        # The document and the conversion status are built by the server
+        response = ConvertDocumentResponse.model_construct(
             document=document,
             status=conv_res.status,
             processing_time=processing_time,
@@ -1,6 +1,6 @@
 import sys
 from pathlib import Path
-from typing import Optional, Union
+from typing import Literal, Optional, Union
 
 from pydantic import AnyUrl, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -24,6 +24,9 @@ class UvicornSettings(BaseSettings):
     ssl_keyfile: Optional[Path] = None
     ssl_keyfile_password: Optional[str] = None
     workers: Union[int, None] = None
+    # "auto" selects uvloop and httptools when installed (uvicorn[standard])
+    loop: Literal["auto", "asyncio", "uvloop"] = "auto"
+    http: Literal["auto", "h11", "httptools"] = "auto"
 
 
 class DoclingServeSettings(BaseSettings):
@@ -42,6 +45,7 @@ class DoclingServeSettings(BaseSettings):
     single_use_results: bool = True
     result_removal_delay: float = 300  # 5 minutes
     options_cache_size: int = 2
+    load_models_at_boot: bool = True
     enable_remote_services: bool = False
     allow_external_plugins: bool = False
 
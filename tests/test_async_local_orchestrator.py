@@ -0,0 +1,75 @@
+import asyncio
+
+import pytest
+
+from docling_serve.datamodel.convert import ConvertDocumentsOptions
+from docling_serve.datamodel.engines import TaskStatus
+from docling_serve.engines.async_local.orchestrator import AsyncLocalOrchestrator
+
+
+@pytest.mark.asyncio
+async def test_task_status_with_position():
+    orchestrator = AsyncLocalOrchestrator()
+    options = ConvertDocumentsOptions()
+    first = await orchestrator.enqueue(sources=[], options=options)
+    second = await orchestrator.enqueue(sources=[], options=options)
+
+    task, position = await orchestrator.task_status_with_position(second.task_id)
+    assert task is second
+    assert position == 2
+
+    # Tasks which left the queue have no position
+    assert await orchestrator.dequeue() == first.task_id
+    first.set_status(TaskStatus.STARTED)
+    task, position = await orchestrator.task_status_with_position(first.task_id)
+    assert task is first
+    assert position is None
+    _, position = await orchestrator.task_status_with_position(second.task_id)
+    assert position == 1
+
+
+@pytest.mark.asyncio
+async def test_notify_queue_positions():
+    orchestrator = AsyncLocalOrchestrator()
+    options = ConvertDocumentsOptions()
+    tasks = [await orchestrator.enqueue(sources=[], options=options) for _ in range(3)]
+
+    positions = await orchestrator.get_queue_positions(
+        [task.task_id for task in tasks] + ["missing"]
+    )
+    assert positions == {
+        tasks[0].task_id: 1,
+        tasks[1].task_id: 2,
+        tasks[2].task_id: 3,
+        "missing": None,
+    }
+
+    queue = orchestrator.subscribe(tasks[2].task_id)
+    assert await orchestrator.dequeue() == tasks[0].task_id
+    await orchestrator.notify_queue_positions()
+
+    # Only the tasks with subscribers are notified
+    assert queue.qsize() == 1
+    assert '"task_position":2' in queue.get_nowait()
+
+
+@pytest.mark.asyncio
+async def test_task_status_wait():
+    orchestrator = AsyncLocalOrchestrator()
+    task = await orchestrator.enqueue(sources=[], options=ConvertDocumentsOptions())
+
+    task = await orchestrator.task_status(task.task_id, wait=0.05)
+    assert task.task_status == TaskStatus.PENDING
+
+    async def _complete():
+        await asyncio.sleep(0.05)
+        task.set_status(TaskStatus.SUCCESS)
+
+    loop = asyncio.get_running_loop()
+    start_time = loop.time()
+    completer = asyncio.create_task(_complete())
+    task = await orchestrator.task_status(task.task_id, wait=5)
+    await completer
+
+    assert task.task_status == TaskStatus.SUCCESS
+    assert loop.time() - start_time < 1
@@ -0,0 +1,25 @@
+import pytest
+from pydantic import TypeAdapter, ValidationError
+
+from docling_serve.datamodel.requests import (
+    ConvertDocumentFileSourcesRequest,
+    ConvertDocumentHttpSourcesRequest,
+    ConvertDocumentsRequest,
+)
+
+adapter: TypeAdapter = TypeAdapter(ConvertDocumentsRequest)
+
+
+def test_convert_request_discriminator():
+    request = adapter.validate_python(
+        {"http_sources": [{"url": "https://arxiv.org/pdf/2206.01062"}]}
+    )
+    assert isinstance(request, ConvertDocumentHttpSourcesRequest)
+
+    request = adapter.validate_python(
+        {"file_sources": [{"base64_string": "", "filename": "empty.md"}]}
+    )
+    assert isinstance(request, ConvertDocumentFileSourcesRequest)
+
+    with pytest.raises(ValidationError):
+        adapter.validate_python({"options": {}})
@@ -0,0 +1,25 @@
+import base64
+import os
+
+import pytest
+
+from docling_serve.datamodel import requests
+from docling_serve.datamodel.requests import FileSource
+
+
+@pytest.mark.parametrize("size", [0, 1, 2, 3, 4, 100, 1000])
+@pytest.mark.parametrize("wrap", [False, True])
+def test_to_document_stream(monkeypatch, size, wrap):
+    # Small slices to cross many boundaries
+    monkeypatch.setattr(requests, "_BASE64_CHUNK_SIZE", 8)
+    content = os.urandom(size)
+    encoded = base64.b64encode(content).decode()
+    if wrap:
+        # Like `base64` without -w 0
+        encoded = "\n".join(encoded[i : i + 76] for i in range(0, len(encoded), 76))
+
+    source = FileSource(base64_string=encoded, filename="file.pdf")
+    stream = source.to_document_stream()
+
+    assert stream.name == "file.pdf"
+    assert stream.stream.read() == content
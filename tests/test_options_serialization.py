@@ -3,7 +3,10 @@ from docling_serve.datamodel.convert import (
     PictureDescriptionApi,
 )
 from docling_serve.docling_conversion import (
+    _get_converter_from_key,
+    _get_options_key,
     _hash_pdf_format_option,
+    get_converter_for_options,
     get_pdf_pipeline_opts,
 )
 
@@ -52,3 +55,31 @@ def test_options_cache_key():
     # pprint(pipeline_opts.pipeline_options.model_dump(serialize_as_any=True))
     assert hash not in hashes
     hashes.add(hash)
+
+
+def test_converter_for_options_cache():
+    opts = ConvertDocumentsOptions()
+    converter = get_converter_for_options(opts)
+
+    # Options which do not affect the pipeline reuse the converter
+    opts.to_formats = []
+    opts.return_as_file = True
+    assert get_converter_for_options(opts) is converter
+
+    hits = _get_options_key.cache_info().hits
+    get_converter_for_options(opts)
+    assert _get_options_key.cache_info().hits == hits + 1
+
+    opts.picture_description_api = PictureDescriptionApi(
+        url="http://localhost",
+        params={"model": "mymodel"},
+    )
+    assert get_converter_for_options(opts) is not converter
+
+
+def test_converter_cache_bounded():
+    for images_scale in [1.0, 2.0, 3.0, 4.0]:
+        get_converter_for_options(ConvertDocumentsOptions(images_scale=images_scale))
+
+    info = _get_converter_from_key.cache_info()
+    assert info.currsize == info.maxsize
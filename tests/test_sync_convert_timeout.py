@@ -0,0 +1,45 @@
+import base64
+
+import pytest
+from fastapi.testclient import TestClient
+
+from docling_serve.app import create_app
+from docling_serve.engines.async_local.orchestrator import AsyncLocalOrchestrator
+from docling_serve.engines.async_orchestrator_factory import get_async_orchestrator
+from docling_serve.settings import docling_serve_settings
+
+
+@pytest.fixture
+def orchestrator():
+    return AsyncLocalOrchestrator()
+
+
+@pytest.fixture
+def client(orchestrator):
+    app = create_app()
+    # Isolated orchestrator without the lifespan: no queue processor is running,
+    # so the enqueued tasks stay pending
+    app.dependency_overrides[get_async_orchestrator] = lambda: orchestrator
+    return TestClient(app)
+
+
+def test_sync_convert_timeout(monkeypatch, client, orchestrator):
+    """The sync endpoint gives up after max_sync_wait with a 504."""
+    monkeypatch.setattr(docling_serve_settings, "max_sync_wait", 1)
+
+    response = client.post(
+        "/v1alpha/convert/source",
+        json={
+            "file_sources": [
+                {
+                    "base64_string": base64.b64encode(b"# Title").decode(),
+                    "filename": "doc.md",
+                }
+            ]
+        },
+    )
+
+    assert response.status_code == 504
+    assert "DOCLING_SERVE_MAX_SYNC_WAIT=1" in response.json()["detail"]
+    assert len(orchestrator.tasks) == 1
+    assert not next(iter(orchestrator.tasks.values())).is_completed()
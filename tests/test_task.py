@@ -0,0 +1,98 @@
+import asyncio
+
+import pytest
+
+from docling_serve.datamodel.engines import TaskStatus
+from docling_serve.datamodel.responses import MessageKind
+from docling_serve.datamodel.task import Task
+from docling_serve.datamodel.task_meta import TaskProcessingMeta
+
+
+@pytest.mark.asyncio
+async def test_wait_completed_wakes_on_terminal_status():
+    task = Task(task_id="task-1", options=None)
+
+    async def _complete():
+        await asyncio.sleep(0.05)
+        task.set_status(TaskStatus.STARTED)
+        await asyncio.sleep(0.05)
+        task.set_status(TaskStatus.SUCCESS)
+
+    loop = asyncio.get_running_loop()
+    start_time = loop.time()
+    completer = asyncio.create_task(_complete())
+    assert await task.wait_completed(timeout=5)
+    elapsed_time = loop.time() - start_time
+    await completer
+
+    assert task.is_completed()
+    # Woken by the status change, not by the timeout
+    assert elapsed_time < 1
+
+
+@pytest.mark.asyncio
+async def test_wait_completed_not_set_by_started():
+    task = Task(task_id="task-2", options=None)
+    task.set_status(TaskStatus.STARTED)
+
+    assert not await task.wait_completed(timeout=0.05)
+
+
+@pytest.mark.asyncio
+async def test_wait_completed_after_failure():
+    task = Task(task_id="task-3", options=None)
+    task.set_status(TaskStatus.FAILURE)
+
+    assert await task.wait_completed(timeout=0.05)
+
+
+@pytest.mark.asyncio
+async def test_wait_completed_timeout():
+    task = Task(task_id="task-4", options=None)
+
+    assert not await task.wait_completed(timeout=0.05)
+    assert not task.is_completed()
+
+
+def test_status_message_reused():
+    task = Task(task_id="task-5", options=None)
+
+    update = task.get_status_message(MessageKind.UPDATE, 1)
+    connection = task.get_status_message(MessageKind.CONNECTION, 1)
+
+    # Each kind is cached on its own
+    assert task.get_status_message(MessageKind.UPDATE, 1) is update
+    assert task.get_status_message(MessageKind.CONNECTION, 1) is connection
+    assert '"message":"update"' in update
+    assert '"message":"connection"' in connection
+
+    # A new queue position is serialized again
+    assert '"task_position":2' in task.get_status_message(MessageKind.UPDATE, 2)
+
+
+def test_status_message_invalidated_by_set_status():
+    task = Task(task_id="task-6", options=None)
+    pending = task.get_status_message(MessageKind.UPDATE, None)
+
+    # Setting the same status again keeps the cached message
+    task.set_status(TaskStatus.PENDING)
+    assert task.get_status_message(MessageKind.UPDATE, None) is pending
+
+    task.set_status(TaskStatus.STARTED)
+    started = task.get_status_message(MessageKind.UPDATE, None)
+    assert '"task_status":"started"' in started
+
+
+def test_status_message_invalidated_explicitly():
+    task = Task(task_id="task-7", options=None)
+    task.processing_meta = TaskProcessingMeta(num_docs=2)
+    before = task.get_status_message(MessageKind.UPDATE, None)
+
+    # In-place changes are not seen by the task, like the KFP progress callback
+    task.processing_meta.num_processed += 1
+    assert task.get_status_message(MessageKind.UPDATE, None) is before
+
+    task.invalidate_status()
+    after = task.get_status_message(MessageKind.UPDATE, None)
+    assert '"num_processed":1' in after
+    assert '"num_processed":0' in before
@@ -0,0 +1,100 @@
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from docling_serve.app import create_app
+from docling_serve.datamodel.engines import TaskStatus
+from docling_serve.datamodel.task import Task
+from docling_serve.engines.async_local.orchestrator import AsyncLocalOrchestrator
+from docling_serve.engines.async_orchestrator_factory import get_async_orchestrator
+
+
+@pytest.fixture(scope="module")
+def orchestrator():
+    return AsyncLocalOrchestrator()
+
+
+@pytest.fixture(scope="module")
+def client(orchestrator):
+    app = create_app()
+    # Isolated orchestrator without the lifespan, the tasks are tracked by the
+    # tests and never processed
+    app.dependency_overrides[get_async_orchestrator] = lambda: orchestrator
+    return TestClient(app)
+
+
+def _track_task(orchestrator: AsyncLocalOrchestrator, task: Task):
+    asyncio.run(orchestrator.init_task_tracking(task))
+
+
+def test_task_status_ws_push(client, orchestrator):
+    """Updates are pushed after the connection message, until the task completes."""
+    task = Task(task_id="ws-push", options=None)
+    _track_task(orchestrator, task)
+
+    async def _set_status(status: TaskStatus):
+        task.set_status(status)
+        await orchestrator.notify_task_subscribers(task_id=task.task_id)
+
+    with client.websocket_connect(f"/v1alpha/status/ws/{task.task_id}") as ws:
+        message = ws.receive_json()
+        assert message["message"] == "connection"
+        assert message["task"]["task_status"] == "pending"
+
+        # Run in the loop of the websocket session, like the workers do
+        ws.portal.call(_set_status, TaskStatus.STARTED)
+        message = ws.receive_json()
+        assert message["message"] == "update"
+        assert message["task"]["task_status"] == "started"
+
+        ws.portal.call(_set_status, TaskStatus.SUCCESS)
+        message = ws.receive_json()
+        assert message["message"] == "update"
+        assert message["task"]["task_status"] == "success"
+
+        # The server closes the socket after the terminal status
+        with pytest.raises(WebSocketDisconnect):
+            ws.receive_json()
+
+    assert orchestrator.task_subscribers[task.task_id] == set()
+
+
+def test_task_status_ws_completed_task(client, orchestrator):
+    """A completed task only gets the connection message before closing."""
+    task = Task(task_id="ws-completed", options=None)
+    task.set_status(TaskStatus.FAILURE)
+    _track_task(orchestrator, task)
+
+    with client.websocket_connect(f"/v1alpha/status/ws/{task.task_id}") as ws:
+        message = ws.receive_json()
+        assert message["message"] == "connection"
+        assert message["task"]["task_status"] == "failure"
+
+        with pytest.raises(WebSocketDisconnect):
+            ws.receive_json()
+
+
+def test_task_status_ws_deleted_task(client, orchestrator):
+    """Deleting the task closes the subscribed sockets."""
+    task = Task(task_id="ws-deleted", options=None)
+    _track_task(orchestrator, task)
+
+    with client.websocket_connect(f"/v1alpha/status/ws/{task.task_id}") as ws:
+        message = ws.receive_json()
+        assert message["message"] == "connection"
+
+        ws.portal.call(orchestrator.delete_task, task.task_id)
+
+        with pytest.raises(WebSocketDisconnect):
+            ws.receive_json()
+
+    assert task.task_id not in orchestrator.tasks
+
+
+def test_task_status_ws_not_found(client):
+    with client.websocket_connect("/v1alpha/status/ws/missing") as ws:
+        message = ws.receive_json()
+        assert message["message"] == "error"
+        assert message["error"] == "Task not found."